@@ -6,9 +6,13 @@ import os
 # This setup script compiles specified .py files into native extensions.
 # This is a key part of protecting the source code.
 
+# Directories that never contain modules to compile
+SKIP_DIRS = {"tests", "__pycache__"}
+
 def find_py_files(directory):
     py_files = []
     for root, dirs, files in os.walk(directory):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
         for file in files:
             if file.endswith(".py") and file != "__init__.py" and file != "config.py":
                 py_files.append(os.path.join(root, file))
@@ -16,13 +20,17 @@ def find_py_files(directory):
     py_files.append("build_tools/encrypt_model.py")
     return py_files
 
-setup(
-    ext_modules=cythonize(
-        find_py_files("app"),
-        compiler_directives={'language_level' : "3"}
-    ),
-    include_dirs=[numpy.get_include()]
-)
+# cythonize(nthreads=...) starts worker processes, which on Windows re-import this
+# script; the guard keeps them from re-running setup()
+if __name__ == "__main__":
+    setup(
+        ext_modules=cythonize(
+            find_py_files("app"),
+            nthreads=os.cpu_count() or 4,
+            compiler_directives={'language_level' : "3"}
+        ),
+        include_dirs=[numpy.get_include()]
+    )
 
 # How to run:
 # python build_tools/setup.py build_ext --inplace
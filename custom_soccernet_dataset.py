@@ -2,31 +2,154 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 from datetime import datetime
 from collections import defaultdict
+from multiprocessing.pool import ThreadPool
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
 
-import cv2
 import numpy as np
-import torch
 from tqdm import tqdm
 
 from ultralytics.data.dataset import YOLODataset
-from ultralytics.utils import LOGGER, LOCAL_RANK
-from ultralytics.utils.ops import segments2boxes
+from ultralytics.utils import LOGGER, LOCAL_RANK, NUM_THREADS
 
-from .augment import Compose, Format, LetterBox, v8_transforms
 from .utils import (
     HELP_URL,
     get_hash,
-    load_dataset_cache_file,
-    save_dataset_cache_file,
 )
 
-# Ultralytics dataset *. cache version
-DATASET_CACHE_VERSION = "1.0.3"
+try:
+    import orjson as _json  # optional, parses large annotation files several times faster
+except ImportError:
+    _json = json
+
+# bbox_image fields read for every annotation, in label-array column order (SoccerNet always writes all of them)
+BBOX_IMAGE_KEYS = ("x", "y", "x_center", "y_center", "w", "h")
+_get_bbox_fields = itemgetter(*BBOX_IMAGE_KEYS)
+
+# visualize_sample skips per-box class names above this many boxes
+MAX_VIS_LABELS = 50
+
+# SoccerNet dataset *.cache version (1.1.x: contiguous .npz arrays instead of a pickled dict)
+DATASET_CACHE_VERSION = "1.1.1"
+
+
+def _replace_file(path: Path, write) -> None:
+    """Write ``path`` through a temporary file so readers (and memory maps) never see a partial file."""
+    tmp = path.with_name(f"{path.name}.tmp")
+    with open(tmp, "wb") as f:
+        write(f)
+    os.replace(tmp, path)
+
+
+def save_labels_cache(prefix: str, path: Path, x: dict, version: str) -> None:
+    """
+    Save cached labels as contiguous arrays.
+
+    Every image's ``cls`` and ``bboxes`` are stacked into one (M, 5) float32 array saved as a ``.bboxes.npy``
+    file next to ``path``, so it can be memory-mapped on load. ``path`` itself is an uncompressed ``.npz``
+    holding the per-image ``counts``, ``shapes`` and ``im_files`` plus the cache metadata.
+
+    Args:
+        prefix (str): Prefix for log messages.
+        path (Path): Path where to save the cache file.
+        x (dict): Cache dictionary as built by ``SoccerNetDataset.cache_labels``.
+        version (str): Cache format version stored alongside the labels.
+    """
+    x["version"] = version
+    labels = x["labels"]
+    meta = {k: x[k] for k in ("version", "hash", "results", "msgs", "total_cls")}
+    im_files = "\n".join(lb["im_file"] for lb in labels).encode("utf-8")
+    flat = (
+        np.concatenate([np.hstack((lb["cls"], lb["bboxes"])) for lb in labels]).astype(np.float32)
+        if labels
+        else np.zeros((0, 5), dtype=np.float32)
+    )
+    arrays = {
+        "im_files": np.frombuffer(im_files, dtype=np.uint8),
+        "shapes": np.array([lb["shape"] for lb in labels], dtype=np.int32).reshape(-1, 2),
+        "counts": np.array([len(lb["cls"]) for lb in labels], dtype=np.int32),
+        "meta": np.array(json.dumps(meta)),
+    }
+
+    try:
+        _replace_file(path.with_suffix(".bboxes.npy"), lambda f: np.save(f, flat))
+        _replace_file(path, lambda f: np.savez(f, **arrays))
+        LOGGER.info(f"{prefix}New cache created: {path}")
+    except OSError as e:
+        LOGGER.warning(f"{prefix}Cache directory {path.parent} is not writeable, cache not saved ({e}).")
+
+
+def load_labels_cache(path: Path, version: str, im_files_hash: str) -> dict:
+    """
+    Load labels saved by ``save_labels_cache``.
+
+    The box array is memory-mapped copy-on-write, and each label's ``cls``/``bboxes`` are views into it, so
+    label pages are read on demand and shared between dataloader workers. Version and hash are checked from the
+    ``.npz`` metadata before mapping, so a stale cache leaves no open mapping behind (on Windows that would stop
+    the rebuilt cache from replacing the file).
+
+    Args:
+        path (Path): Path of the cache file.
+        version (str): Expected cache format version.
+        im_files_hash (str): Expected hash of the dataset image files.
+
+    Returns:
+        (dict): Dictionary with ``labels``, ``version``, ``hash``, ``results``, ``msgs`` and ``total_cls`` keys.
+    """
+    with np.load(path, allow_pickle=False) as data:
+        meta = json.loads(data["meta"].item())
+        im_files = data["im_files"].tobytes().decode("utf-8").split("\n")
+        shapes = data["shapes"].tolist()
+        counts = data["counts"]
+
+    if meta["version"] != version or meta["hash"] != im_files_hash:
+        raise ValueError(f"Cache {path} is out of date")
+
+    flat = np.load(path.with_suffix(".bboxes.npy"), mmap_mode="c")
+    if len(flat) != counts.sum():
+        del flat  # release the mapping before the caller rebuilds the cache
+        raise ValueError(f"Label arrays of {path} are out of sync")
+
+    offsets = np.concatenate(([0], np.cumsum(counts))).tolist()
+    labels = [
+        {
+            "im_file": im_file,
+            "shape": tuple(shape),
+            "cls": flat[start:end, 0:1],  # n, 1
+            "bboxes": flat[start:end, 1:],  # n, 4
+            "segments": [],
+            "keypoints": None,
+            "normalized": True,
+            "bbox_format": "xywh",
+        }
+        for im_file, shape, start, end in zip(im_files, shapes, offsets[:-1], offsets[1:])
+    ]
+    return {"labels": labels, **meta}
+
+
+def denormalize_boxes(bboxes: np.ndarray, shape: tuple[int, int], normalized: bool) -> np.ndarray:
+    """
+    Convert center-based xywh boxes to absolute x1, y1, x2, y2 corners in one vectorized pass.
+
+    Args:
+        bboxes (np.ndarray): (N, 4) array of x_center, y_center, width, height.
+        shape (tuple[int, int]): Image (height, width), used when ``normalized`` is True.
+        normalized (bool): Whether ``bboxes`` are normalized to [0, 1].
+
+    Returns:
+        (np.ndarray): (N, 4) array of x1, y1, x2, y2 in pixels.
+    """
+    xy, wh = bboxes[:, :2], bboxes[:, 2:]
+    xyxy = np.concatenate((xy - wh / 2, xy + wh / 2), axis=1)
+    if normalized:
+        h, w = shape
+        xyxy *= (w, h, w, h)
+    return xyxy
 
 
 class SoccerNetDataset(YOLODataset):
@@ -96,25 +219,64 @@ class SoccerNetDataset(YOLODataset):
         """
         img_path = Path(img_path)
         img_files = []
+        total_size = 0  # summed from the scandir entries, see _get_hash()
 
-        # Find all sequence directories (e.g., SNGS-060, SNGS-061)
-        sequence_dirs = [d for d in img_path.iterdir() if d.is_dir()]
+        # Find all sequence directories (e.g., SNGS-060, SNGS-061); scandir entries
+        # carry their type, so this needs no extra stat() per entry. Sorting by normcase
+        # keeps the order of sorted Path objects (case-insensitive on Windows)
+        with os.scandir(img_path) as it:
+            sequence_dirs = sorted((entry.path for entry in it if entry.is_dir()), key=os.path.normcase)
 
-        for seq_dir in sorted(sequence_dirs):
+        for seq_dir in sequence_dirs:
             # Look for img1 directory inside each sequence
-            img_dir = seq_dir / "img1"
-            if img_dir.exists():
-                # Collect all . jpg files
-                images = sorted(img_dir.glob("*.jpg"))
-                img_files.extend([str(img) for img in images])
+            img_dir = os.path.join(seq_dir, "img1")
+            if os.path.isdir(img_dir):
+                # Collect all .jpg files; normcase matches like glob (case-insensitive only on Windows)
+                with os.scandir(img_dir) as it:
+                    entries = [entry for entry in it if os.path.normcase(entry.name).endswith(".jpg")]
+                entries.sort(key=lambda entry: os.path.normcase(entry.name))
+                img_files.extend(entry.path for entry in entries)
+                # DirEntry.stat() is served from the directory listing on Windows and cached per entry elsewhere;
+                # unreadable entries count as size 0, as in get_hash
+                for entry in entries:
+                    try:
+                        total_size += entry.stat().st_size
+                    except OSError:
+                        continue
 
         if not img_files:
             LOGGER.warning(f"No images found in {img_path}")
         else:
             LOGGER.info(f"Found {len(img_files)} images in {img_path}")
 
+        self._scanned_size = img_files, total_size
         return img_files
 
+    def _get_hash(self) -> str:
+        """
+        Return the cache hash of ``self.im_files``, computed once per list.
+
+        For the list returned by ``get_img_files`` this reuses the file sizes gathered during the directory scan, so
+        validating the cache needs no further stat() calls. The digest is built the same way as ``get_hash``.
+
+        Returns:
+            (str): Hex digest of the image paths and their total size.
+        """
+        cached = getattr(self, "_hash_cached", None)
+        if cached is not None and cached[0] is self.im_files:
+            return cached[1]
+
+        scanned = getattr(self, "_scanned_size", None)
+        if scanned is not None and scanned[0] is self.im_files:
+            h = hashlib.sha256(str(scanned[1]).encode())
+            h.update("".join(self.im_files).encode())
+            digest = h.hexdigest()
+        else:
+            digest = get_hash(self.im_files)
+
+        self._hash_cached = self.im_files, digest
+        return digest
+
     def cache_labels(self, path: Path = Path("./labels.cache")) -> dict:
         """
         Cache dataset labels by reading JSON files from the SoccerNet structure.
@@ -127,128 +289,44 @@ class SoccerNetDataset(YOLODataset):
         """
         x = {"labels": []}
         nm, nf, ne, nc, msgs = 0, 0, 0, 0, []  # number missing, found, empty, corrupt, messages
+        total_cls = 0  # number of boxes over all labels
 
         # Group images by sequence
         img_by_sequence = defaultdict(list)
         json_files = {}
 
+        seq_dirs = {}
         for img_file in self.im_files:
-            img_path = Path(img_file)
-            # Get sequence directory (parent of img1)
-            seq_dir = img_path.parent.parent
-            seq_name = seq_dir.name
+            # Get sequence directory (parent of img1); plain string ops, no Path per image
+            seq_dir = os.path.dirname(os.path.dirname(img_file))
+            seq_name = os.path.basename(seq_dir)
             img_by_sequence[seq_name].append(img_file)
+            seq_dirs[seq_name] = seq_dir
 
-            # Store JSON file path
-            json_file = seq_dir / f"Labels-GameState.json"
+        # Store JSON file paths, checked once per sequence
+        for seq_name, seq_dir in seq_dirs.items():
+            json_file = Path(seq_dir) / "Labels-GameState.json"
             if json_file.exists():
                 json_files[seq_name] = json_file
 
         desc = f"{self.prefix}Loading SoccerNet annotations..."
 
-        # Process each sequence
-        for seq_name in tqdm(sorted(img_by_sequence.keys()), desc=desc):
-            if seq_name not in json_files:
-                msgs.append(f"Missing JSON file for sequence {seq_name}")
-                nm += len(img_by_sequence[seq_name])
-                continue
-
-            try:
-                # Load JSON annotations
-                with open(json_files[seq_name], "r") as f:
-                    data = json.load(f)
-
-                # Create mapping:  image_id -> annotations
-                img_annotations = defaultdict(list)
-                for ann in data["annotations"]:
-                    img_annotations[ann["image_id"]].append(ann)
-
-                # Create mapping: image_id -> image info
-                img_info_map = {img["image_id"]: img for img in data["images"]}
-
-                # Process each image in this sequence
-                for img_file in img_by_sequence[seq_name]:
-                    img_path = Path(img_file)
-                    file_name = img_path.name
-
-                    # Find matching image info
-                    img_info = None
-                    for info in data["images"]:
-                        if info["file_name"] == file_name:
-                            img_info = info
-                            break
-
-                    if img_info is None:
-                        nm += 1
-                        continue
-
-                    # Get image dimensions
-                    h = img_info["height"]
-                    w = img_info["width"]
-                    image_id = img_info["image_id"]
-
-                    # Get annotations for this image
-                    anns = img_annotations.get(image_id, [])
-
-                    if not anns:
-                        ne += 1
-                        continue
-
-                    # Process annotations
-                    bboxes = []
-                    segments = []
-
-                    for ann in anns:
-                        # Get category_id (class)
-                        cls = ann["category_id"]
-
-                        # Get bbox_image (already in the format we need)
-                        bbox = ann.get("bbox_image", {})
-                        if not bbox:
-                            continue
-
-                        # Extract bbox coordinates (normalized)
-                        x_center = bbox.get("x_center", 0.0)
-                        y_center = bbox.get("y_center", 0.0)
-                        bbox_w = bbox.get("w", 0)
-                        bbox_h = bbox.get("h", 0)
-
-                        # Normalize if not already normalized
-                        if bbox_w > 1 or bbox_h > 1:
-                            x_center = (bbox.get("x", 0) + bbox_w / 2) / w
-                            y_center = (bbox.get("y", 0) + bbox_h / 2) / h
-                            bbox_w = bbox_w / w
-                            bbox_h = bbox_h / h
-
-                        # Skip invalid boxes
-                        if bbox_w <= 0 or bbox_h <= 0:
-                            continue
-
-                        bboxes.append([cls, x_center, y_center, bbox_w, bbox_h])
-
-                    if not bboxes:
-                        ne += 1
-                        continue
-
-                    # Convert to numpy array
-                    lb = np.array(bboxes, dtype=np.float32)
-
-                    # Add to labels
-                    x["labels"].append({
-                        "im_file": str(img_file),
-                        "shape": (h, w),
-                        "cls": lb[:, 0:1],  # n, 1
-                        "bboxes": lb[:, 1:],  # n, 4
-                        "segments": [],
-                        "keypoints": None,
-                        "normalized": True,
-                        "bbox_format": "xywh",
-                    })
-                    nf += 1
-
-            except Exception as e:
-                msgs.append(f"Error processing {seq_name}: {str(e)}")
-                nc += 1
+        # Sequences have independent JSON files, so read and parse them in parallel; imap keeps them in order
+        seq_names = sorted(img_by_sequence.keys())
+        with ThreadPool(NUM_THREADS) as pool:
+            results = pool.imap(
+                func=self._cache_sequence,
+                iterable=((seq_name, json_files.get(seq_name), img_by_sequence[seq_name]) for seq_name in seq_names),
+            )
+            for labels, nm_s, nf_s, ne_s, nc_s, msg in tqdm(results, desc=desc, total=len(seq_names)):
+                x["labels"].extend(labels)
+                total_cls += sum(len(lb["cls"]) for lb in labels)
+                nm += nm_s
+                nf += nf_s
+                ne += ne_s
+                nc += nc_s
+                if msg:
+                    msgs.append(msg)
 
         if msgs:
             LOGGER.info("\n".join(msgs))
@@ -256,10 +334,11 @@ class SoccerNetDataset(YOLODataset):
         if nf == 0:
             LOGGER.warning(f"{self.prefix}No labels found in {path}. {HELP_URL}")
 
-        x["hash"] = get_hash(self.im_files)
+        x["hash"] = self._get_hash()
         x["results"] = nf, nm, ne, nc, len(self.im_files)
         x["msgs"] = msgs
-        save_dataset_cache_file(self.prefix, path, x, DATASET_CACHE_VERSION)
+        x["total_cls"] = total_cls
+        save_labels_cache(self.prefix, path, x, DATASET_CACHE_VERSION)
 
         LOGGER.info(
             f"{self.prefix}Successfully loaded {nf} images with annotations, "
@@ -268,20 +347,146 @@ class SoccerNetDataset(YOLODataset):
 
         return x
 
+    def _cache_sequence(self, args: tuple) -> tuple:
+        """
+        Build labels for the images of a single SoccerNet sequence.
+
+        Args:
+            args (tuple): Sequence name, path to its JSON file (None if missing), and its image files.
+
+        Returns:
+            (tuple): Labels list, counts of missing, found, empty and corrupt images, and a message or None.
+        """
+        seq_name, json_file, img_files = args
+        labels = []
+        nm, nf, ne, nc, msg = 0, 0, 0, 0, None  # number missing, found, empty, corrupt, message
+
+        if json_file is None:
+            return labels, len(img_files), nf, ne, nc, f"Missing JSON file for sequence {seq_name}"
+
+        try:
+            # Load JSON annotations (both parsers accept the raw UTF-8 bytes)
+            data = _json.loads(Path(json_file).read_bytes())
+
+            # Annotations that carry a bbox_image (already in the format we need)
+            bbox_anns = [ann for ann in data["annotations"] if ann.get("bbox_image")]
+            n = len(bbox_anns)
+
+            # Sort rows by image_id so every image's boxes are one contiguous slice: image_id -> (start, count).
+            # The stable sort keeps each image's annotations in file order.
+            groups = {}
+            if n:
+                # One row per annotation: category_id, x, y, x_center, y_center, w, h
+                cls = np.fromiter((ann["category_id"] for ann in bbox_anns), dtype=np.float64, count=n)
+                try:
+                    boxes = np.fromiter(
+                        (_get_bbox_fields(ann["bbox_image"]) for ann in bbox_anns),
+                        dtype=np.dtype((np.float64, len(BBOX_IMAGE_KEYS))),
+                        count=n,
+                    )
+                except KeyError:
+                    # Some exports omit fields; missing values count as 0
+                    boxes = np.array(
+                        [[ann["bbox_image"].get(k, 0) for k in BBOX_IMAGE_KEYS] for ann in bbox_anns],
+                        dtype=np.float64,
+                    )
+
+                ids = np.asarray([ann["image_id"] for ann in bbox_anns])
+                order = np.argsort(ids, kind="stable")
+                uniq, starts, counts = np.unique(ids[order], return_index=True, return_counts=True)
+                raw = np.column_stack((cls, boxes))[order]
+                groups = dict(zip(uniq.tolist(), zip(starts.tolist(), counts.tolist())))
+
+            # Create mapping: file_name -> image info
+            img_info_by_name = {img["file_name"]: img for img in data["images"]}
+
+            # Process each image in this sequence
+            for img_file in img_files:
+                # Find matching image info
+                img_info = img_info_by_name.get(os.path.basename(img_file))
+
+                if img_info is None:
+                    nm += 1
+                    continue
+
+                # Get image dimensions
+                h = img_info["height"]
+                w = img_info["width"]
+
+                # Get boxes for this image
+                group = groups.get(img_info["image_id"])
+
+                if group is None:
+                    ne += 1
+                    continue
+
+                start, count = group
+                cls, bbox_x, bbox_y, x_center, y_center, bbox_w, bbox_h = raw[start : start + count].T
+
+                # Normalize boxes that are not already normalized
+                absolute = (bbox_w > 1) | (bbox_h > 1)
+                x_center = np.where(absolute, (bbox_x + bbox_w / 2) / w, x_center)
+                y_center = np.where(absolute, (bbox_y + bbox_h / 2) / h, y_center)
+                bbox_w = np.where(absolute, bbox_w / w, bbox_w)
+                bbox_h = np.where(absolute, bbox_h / h, bbox_h)
+
+                # Skip invalid boxes
+                valid = (bbox_w > 0) & (bbox_h > 0)
+
+                if not valid.any():
+                    ne += 1
+                    continue
+
+                # Convert to a single (n, 5) float32 array
+                lb = np.stack((cls, x_center, y_center, bbox_w, bbox_h), axis=1)[valid].astype(np.float32)
+
+                # Add to labels
+                labels.append({
+                    "im_file": str(img_file),
+                    "shape": (h, w),
+                    "cls": lb[:, 0:1],  # n, 1
+                    "bboxes": lb[:, 1:],  # n, 4
+                    "segments": [],
+                    "keypoints": None,
+                    "normalized": True,
+                    "bbox_format": "xywh",
+                })
+                nf += 1
+
+        except Exception as e:
+            msg = f"Error processing {seq_name}: {str(e)}"
+            nc += 1
+
+        return labels, nm, nf, ne, nc, msg
+
     def get_labels(self) -> list[dict]:
         """
         Return dictionary of labels for YOLO training.
 
+        The validated cache is remembered on the instance until ``self.im_files`` is reassigned, so later calls
+        from ``to_coco`` and ``visualize_sample`` map it again without rescanning or rehashing the dataset. A fresh
+        copy-on-write mapping holds the labels as saved, so edits made to ``self.labels`` by ``update_labels``
+        (class filtering, ``single_cls``) do not leak into exports.
+
         Returns:
             (list[dict]): List of label dictionaries.
         """
+        cached = getattr(self, "_labels_cached", None)
+        if cached is not None and cached[0] is self.im_files:
+            _, cache_path, im_hash, scanned_files = cached
+            try:
+                return load_labels_cache(cache_path, DATASET_CACHE_VERSION, im_hash)["labels"]
+            except (FileNotFoundError, AttributeError, KeyError, ValueError):
+                # Cache was not saved or changed on disk since; rebuild it for the scanned images, not the subset
+                self.im_files = scanned_files
+
         cache_path = Path(self.img_path).parent / f"{Path(self.img_path).name}_labels.cache"
+        scanned_files, im_hash = self.im_files, self._get_hash()
 
         try:
-            cache, exists = load_dataset_cache_file(cache_path), True
-            assert cache["version"] == DATASET_CACHE_VERSION
-            assert cache["hash"] == get_hash(self.im_files)
-        except (FileNotFoundError, AssertionError, AttributeError):
+            cache, exists = load_labels_cache(cache_path, DATASET_CACHE_VERSION, im_hash), True
+        except (FileNotFoundError, AttributeError, KeyError, ValueError):
+            # ValueError: stale version/hash, or caches from older versions (pickled dicts) and other formats
             cache, exists = self.cache_labels(cache_path), False
 
         # Display cache info
@@ -293,6 +498,7 @@ class SoccerNetDataset(YOLODataset):
                 LOGGER.info("\n".join(cache["msgs"]))
 
         # Read cache
+        total_cls = cache.pop("total_cls")
         [cache.pop(k) for k in ("hash", "version", "msgs")]
         labels = cache["labels"]
 
@@ -304,12 +510,12 @@ class SoccerNetDataset(YOLODataset):
         self.im_files = [lb["im_file"] for lb in labels]
 
         # Check for class distribution
-        len_cls = sum(len(lb["cls"]) for lb in labels)
-        if len_cls == 0:
+        if total_cls == 0:
             LOGGER.warning(
                 f"{self.prefix}No objects found in dataset. Training may not work correctly."
             )
 
+        self._labels_cached = self.im_files, cache_path, im_hash, scanned_files
         return labels
 
     def to_coco(self, save_path: str | Path) -> dict:
@@ -340,35 +546,24 @@ class SoccerNetDataset(YOLODataset):
                 }
             )
 
-            cls = label["cls"].reshape(-1)
-            bboxes = label["bboxes"]
-            normalized = label.get("normalized", False)
-
-            for i, class_id in enumerate(cls):
-                x_c, y_c, bw, bh = bboxes[i]
-                if normalized:
-                    x_abs = float((x_c - bw / 2) * w)
-                    y_abs = float((y_c - bh / 2) * h)
-                    bw_abs = float(bw * w)
-                    bh_abs = float(bh * h)
-                else:
-                    x_abs = float(x_c - bw / 2)
-                    y_abs = float(y_c - bh / 2)
-                    bw_abs = float(bw)
-                    bh_abs = float(bh)
-
-                annotations.append(
-                    {
-                        "id": ann_id,
-                        "image_id": img_id,
-                        "category_id": int(class_id),
-                        "bbox": [x_abs, y_abs, bw_abs, bh_abs],
-                        "area": bw_abs * bh_abs,
-                        "iscrowd": 0,
-                        "segmentation": [],
-                    }
-                )
-                ann_id += 1
+            cls = label["cls"].reshape(-1).astype(int).tolist()
+            xywh = denormalize_boxes(label["bboxes"], (h, w), label.get("normalized", False))
+            xywh[:, 2:] -= xywh[:, :2]  # x2, y2 -> width, height
+
+            # tolist() converts all rows to Python floats in a single C call
+            annotations.extend(
+                {
+                    "id": ann_id + i,
+                    "image_id": img_id,
+                    "category_id": class_id,
+                    "bbox": box,
+                    "area": box[2] * box[3],
+                    "iscrowd": 0,
+                    "segmentation": [],
+                }
+                for i, (class_id, box) in enumerate(zip(cls, xywh.tolist()))
+            )
+            ann_id += len(cls)
 
         coco = {
             "info": {
@@ -392,6 +587,8 @@ class SoccerNetDataset(YOLODataset):
 
     def visualize_sample(self, index: int = 0, save_path: str | Path | None = None) -> Path | None:
         """Render a single sample with bounding boxes to help spot-check annotations."""
+        import cv2  # only needed here
+
         labels = self.get_labels()
         if not labels:
             LOGGER.warning("No labels available to visualize")
@@ -403,37 +600,29 @@ class SoccerNetDataset(YOLODataset):
             LOGGER.warning(f"Unable to read image {label['im_file']}")
             return None
 
-        h, w = label["shape"]
-        cls = label["cls"].reshape(-1)
-        bboxes = label["bboxes"]
-        normalized = label.get("normalized", False)
-
-        for i, class_id in enumerate(cls):
-            x_c, y_c, bw, bh = bboxes[i]
-            if normalized:
-                x1 = int((x_c - bw / 2) * w)
-                y1 = int((y_c - bh / 2) * h)
-                x2 = int((x_c + bw / 2) * w)
-                y2 = int((y_c + bh / 2) * h)
-            else:
-                x1 = int(x_c - bw / 2)
-                y1 = int(y_c - bh / 2)
-                x2 = int(x_c + bw / 2)
-                y2 = int(y_c + bh / 2)
-
-            color = tuple(int(c) for c in np.random.randint(0, 255, size=3))
-            cv2.rectangle(img, (x1, y1), (x2, y2), color, 2)
-            name = self.data.get("names", {}).get(int(class_id), str(int(class_id)))
-            cv2.putText(
-                img,
-                name,
-                (x1, max(y1 - 5, 0)),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.5,
-                color,
-                1,
-                cv2.LINE_AA,
-            )
+        cls = label["cls"].reshape(-1).astype(int)
+        xyxy = denormalize_boxes(label["bboxes"], label["shape"], label.get("normalized", False)).astype(np.int32)
+        corners = xyxy[:, [0, 1, 2, 1, 2, 3, 0, 3]].reshape(-1, 4, 2)  # (n, 4, 2) rectangle outlines
+
+        # One color per class, and all boxes of a class drawn in a single polylines call
+        class_ids = np.unique(cls).tolist()
+        colors = dict(zip(class_ids, map(tuple, np.random.randint(0, 255, size=(len(class_ids), 3)).tolist())))
+        for class_id in class_ids:
+            cv2.polylines(img, corners[cls == class_id], True, colors[class_id], 2)
+
+        if len(cls) <= MAX_VIS_LABELS:
+            names = self.data.get("names", {})
+            for (x1, y1), class_id in zip(xyxy[:, :2].tolist(), cls.tolist()):
+                cv2.putText(
+                    img,
+                    names.get(class_id, str(class_id)),
+                    (x1, max(y1 - 5, 0)),
+                    cv2.FONT_HERSHEY_SIMPLEX,
+                    0.5,
+                    colors[class_id],
+                    1,
+                    cv2.LINE_AA,
+                )
 
         save_path = Path(save_path) if save_path is not None else Path(label["im_file"]).with_suffix(".vis.jpg")
         cv2.imwrite(str(save_path), img)
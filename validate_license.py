@@ -1,15 +1,59 @@
-import requests
 import sys
+import time
+
+# Seconds a valid verdict for a key is reused before re-validating
+CACHE_TTL_SECS = 300
+
+# license_key -> monotonic timestamp of the last valid verdict
+_validation_cache = {}
+
+# Shared HTTPS session, created on first use so repeat checks reuse the TLS connection
+_session = None
+
+def _get_session():
+    """
+    Returns the shared session, creating it (and importing requests) on first use.
+    """
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        _session = requests.Session()
+        # Validation is read-only, so POST is safe to retry on connection errors;
+        # read timeouts are not retried so a slow server costs one timeout, not three
+        retries = Retry(total=2, read=0, backoff_factor=0.2, allowed_methods=frozenset({"POST"}))
+        _session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=retries))
+    return _session
+
+def clear_validation_cache():
+    """
+    Forgets all cached verdicts, e.g. after a license is deactivated.
+    """
+    _validation_cache.clear()
 
 def validate_license(license_key):
     """
     Validates the license key against the footydjLicensify API.
+
+    Valid verdicts are cached for CACHE_TTL_SECS so repeat checks of the
+    same key skip the network round-trip. Invalid keys, connection and
+    server errors are never cached, so a newly activated key is accepted on
+    the next check.
     """
+    validated_at = _validation_cache.get(license_key)
+    if validated_at is not None and time.monotonic() - validated_at < CACHE_TTL_SECS:
+        return True
+
+    # Imported here so startup (and cached checks) don't pay for requests/urllib3
+    import requests
+
     # URL configured based on the user's dashboard settings
     API_URL = "https://footydj-licence.vercel.app/api/validate"
     
     try:
-        response = requests.post(API_URL, json={
+        response = _get_session().post(API_URL, json={
             "key": license_key
         }, timeout=5)
         
@@ -17,6 +61,7 @@ def validate_license(license_key):
             data = response.json()
             if data.get("valid"):
                 print(f"✅ Success: License is valid until {data.get('expires_at')}")
+                _validation_cache[license_key] = time.monotonic()
                 return True
             else:
                 print(f"❌ Error: {data.get('message', 'License invalid')}")